@@ -1,3 +1,5 @@
+import stat
+from functools import lru_cache
 from typing import Callable
 from .path import PathEntry
 
@@ -14,6 +16,10 @@ XlsdSortMethod = Callable[[list[PathEntry]], list[PathEntry]]
 
 XLSD_SORT_METHODS: dict[str, XlsdSortMethod] = {}
 
+# Listings with more entries than this get their stats fetched in parallel
+PARALLEL_STAT_THRESHOLD = 64
+PARALLEL_STAT_WORKERS = 8
+
 
 def xlsd_register_sort_method(name: str):
     """
@@ -21,10 +27,21 @@ def xlsd_register_sort_method(name: str):
     """
     def decorator(func: XlsdSortMethod):
         XLSD_SORT_METHODS[name] = func
+        xlsd_resolve_sort_method.cache_clear()
         return func
     return decorator
 
 
+@lru_cache(maxsize=8)
+def xlsd_resolve_sort_method(name: str) -> XlsdSortMethod:
+    """
+    Return the sort method registered with a name.
+
+    Unknown names fall back to xlsd_sort_as_is.
+    """
+    return XLSD_SORT_METHODS.get(name, xlsd_sort_as_is)
+
+
 def _direntry_lowercase_name(entry: PathEntry) -> str:
     """
     Return the lowercase name for a DirEntry.
@@ -34,6 +51,60 @@ def _direntry_lowercase_name(entry: PathEntry) -> str:
     return entry.name.lower()
 
 
+def _inode_safe(entry: PathEntry) -> int:
+    """
+    Return the inode number of an entry, or 0 if it can't be determined.
+    """
+    try:
+        return entry.inode()
+    except OSError:
+        return 0
+
+
+def _stat_entries(entries: list[PathEntry]) -> None:
+    """
+    Fetch and cache the lstat of each entry, and the stat of symlink targets.
+
+    Errors are ignored, they will show up again when the entry is rendered.
+    """
+    for entry in entries:
+        try:
+            if stat.S_ISLNK(entry.stat(follow_symlinks=False).st_mode):
+                entry.stat()
+        except OSError:
+            pass
+
+
+def xlsd_prefetch_stats(entries: list[PathEntry], parallel: bool = False) -> None:
+    """
+    Fetch the lstat of all the entries (and the stat of symlink targets), in
+    inode order.
+
+    Walking the inode table in order instead of in alphabetical order avoids a
+    lot of seeking on some filesystems (ext4 for example). The results are
+    cached by the entries, so the stat calls done while rendering are free.
+
+    When parallel is set, large listings are split in contiguous chunks of the
+    inode order, each one handled by a worker thread. This only helps when each
+    stat call is slow (some network filesystems), on a local disk the thread
+    overhead makes it slower.
+    """
+    ordered = sorted(entries, key=_inode_safe)
+
+    if not parallel or len(ordered) <= PARALLEL_STAT_THRESHOLD:
+        _stat_entries(ordered)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    chunk_size = -(-len(ordered) // PARALLEL_STAT_WORKERS)
+    chunks = [ordered[i:i + chunk_size] for i in range(0, len(ordered), chunk_size)]
+    with ThreadPoolExecutor(max_workers=PARALLEL_STAT_WORKERS) as executor:
+        # Consume the iterator so that all the calls are done on exit
+        for _ in executor.map(_stat_entries, chunks):
+            pass
+
+
 @xlsd_register_sort_method('directories_first')
 def xlsd_sort_directories_first(entries: list[PathEntry]) -> list[PathEntry]:
     """
@@ -43,13 +114,10 @@ def xlsd_sort_directories_first(entries: list[PathEntry]) -> list[PathEntry]:
     files = []
 
     for entry in entries:
-        try:
-            if entry.is_dir():
-                directories.append(entry)
-            else:
-                files.append(entry)
-        except OSError:  # Probably circular symbolic link
+        if entry.is_dir():
             directories.append(entry)
+        else:
+            files.append(entry)
 
     directories.sort(key=_direntry_lowercase_name)
     files.sort(key=_direntry_lowercase_name)
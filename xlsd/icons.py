@@ -1,4 +1,6 @@
 import stat
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from typing import Generic, Optional, TypeVar
 
 from wcwidth import wcswidth
@@ -6,6 +8,15 @@ from wcwidth import wcswidth
 T = TypeVar('T')
 
 
+def _fast_width(text: str) -> int:
+    """
+    Return the cell width of some text, skipping wcswidth for printable ASCII.
+    """
+    if text.isascii() and text.isprintable():
+        return len(text)
+    return wcswidth(text)
+
+
 class IconSet(Generic[T]):
     """
     A storage for icons.
@@ -18,6 +29,15 @@ class IconSet(Generic[T]):
     def __init__(self, icons: dict[T, str]):
         self._icons = icons
         self._width = self._compute_width()
+        self._build_padded()
+
+    def _build_padded(self):
+        """
+        Pad all the icons (and the default one) once, so that lookups are a
+        simple dict access.
+        """
+        self._padded = {key: self._pad_icon(icon) for key, icon in self._icons.items()}
+        self._default_padded = self._pad_icon(self._default_icon())
 
     def _compute_width(self) -> int:
         """
@@ -25,7 +45,7 @@ class IconSet(Generic[T]):
         """
         maximum = 0
         for icon in self._icons.values():
-            maximum = max(maximum, wcswidth(icon))
+            maximum = max(maximum, _fast_width(icon))
         return maximum
 
     def add(self, key: T, icon: str):
@@ -33,13 +53,19 @@ class IconSet(Generic[T]):
         Add an icon to this IconSet.
         """
         self._icons[key] = icon
-        self._width = self._compute_width()
+        width = self._compute_width()
+
+        if width != self._width:
+            self._width = width
+            self._build_padded()
+        else:
+            self._padded[key] = self._pad_icon(icon)
 
     def _pad_icon(self, icon: str):
         """
         Pad an icon to this IconSet's width.
         """
-        width = wcswidth(icon)
+        width = _fast_width(icon)
         to_add = self._width - width
 
         if to_add < 0:
@@ -51,40 +77,34 @@ class IconSet(Generic[T]):
         left = to_add - right
         return " "*right + icon + " "*left
 
-    def get_default(self) -> str:
+    def _default_icon(self) -> str:
         """
-        Return a default icon of the correct width.
+        Return the unpadded default icon for this IconSet's width.
         """
         icon = ''
         if self._width == 1:
             icon = '?'
         elif self._width > 1:
             icon = '❔'
+        return icon
 
-        return self._pad_icon(icon)
+    def get_default(self) -> str:
+        """
+        Return a default icon of the correct width.
+        """
+        return self._default_padded
 
     def get(self, key: T) -> str:
         """
         Return the icon or a default one with the correct width.
         """
-        icon = self._icons.get(key, None)
-
-        # use a default icon
-        if icon is None:
-            return self.get_default()
-
-        return self._pad_icon(icon)
+        return self._padded.get(key, self._default_padded)
 
     def get_or_none(self, key: T) -> Optional[str]:
         """
         Return the icon or None.
         """
-        icon = self._icons.get(key, None)
-
-        if icon is None:
-            return None
-
-        return self._pad_icon(icon)
+        return self._padded.get(key, None)
 
 
 STAT_ICONS: IconSet[int] = IconSet({
@@ -208,3 +228,85 @@ EXTENSION_ICONS = [
     ({'db', 'sqlite', 'sqlite3', 'kdbx'}, 'database'),
     ({'torrent'}, 'pirate'),
 ]
+
+
+# Lookup tables built from MIMETYPE_ICONS, rebuilt whenever the list changes.
+_mimetype_rules: list[tuple[str, str]] = []
+_mimetype_exact: dict[str, tuple[int, str]] = {}
+_mimetype_globs: list[tuple[int, str, str]] = []
+
+
+def _build_mimetype_tables():
+    """
+    Split MIMETYPE_ICONS into a dict of exact mimetypes and a list of globs.
+
+    The index of each rule is kept so that the first matching rule still wins.
+    """
+    global _mimetype_rules
+    _mimetype_rules = list(MIMETYPE_ICONS)
+    _mimetype_exact.clear()
+    _mimetype_globs.clear()
+
+    for index, (pattern, icon_name) in enumerate(_mimetype_rules):
+        if any(char in pattern for char in '*?['):
+            _mimetype_globs.append((index, pattern, icon_name))
+        else:
+            _mimetype_exact.setdefault(pattern, (index, icon_name))
+
+    _icon_for_mimetype.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _icon_for_mimetype(mimetype: str) -> Optional[str]:
+    """
+    Return the icon name for a mimetype, using the prebuilt lookup tables.
+    """
+    exact_index, exact_icon = _mimetype_exact.get(mimetype, (len(_mimetype_rules), None))
+
+    for index, pattern, icon_name in _mimetype_globs:
+        if index > exact_index:
+            break
+        if pattern.endswith('/*') and '*' not in pattern[:-1]:
+            if mimetype.startswith(pattern[:-1]):
+                return icon_name
+        elif fnmatchcase(mimetype, pattern):
+            return icon_name
+
+    return exact_icon
+
+
+def icon_for_mimetype(mimetype: str) -> Optional[str]:
+    """
+    Return the name of the icon for a mimetype, or None.
+
+    The first matching rule of MIMETYPE_ICONS is used.
+    """
+    if _mimetype_rules != MIMETYPE_ICONS:
+        _build_mimetype_tables()
+    return _icon_for_mimetype(mimetype)
+
+
+# Lookup table built from EXTENSION_ICONS, rebuilt whenever rules are added,
+# removed or replaced in the list. Sets modified in place are not detected.
+_extension_rules: list[tuple[set[str], str]] = []
+_extension_table: dict[str, str] = {}
+
+
+def icon_for_extension(extension: str) -> Optional[str]:
+    """
+    Return the name of the icon for a (lowercase) file extension, or None.
+
+    The first rule of EXTENSION_ICONS containing the extension is used. Only
+    list-level changes (insert, append, replacing a rule...) are picked up,
+    modifying the set of an existing rule in place is not: checking the sets on
+    every lookup would cost more than the scan this table replaces.
+    """
+    global _extension_rules
+    if _extension_rules != EXTENSION_ICONS:
+        _extension_rules = list(EXTENSION_ICONS)
+        _extension_table.clear()
+        for extensions, icon_name in _extension_rules:
+            for ext in extensions:
+                _extension_table.setdefault(ext, icon_name)
+
+    return _extension_table.get(extension)
@@ -1,5 +1,6 @@
 import os
 import stat
+from typing import Callable, Optional
 
 
 class PathEntry:
@@ -13,6 +14,8 @@ class PathEntry:
     different operations.
     """
 
+    __slots__ = ('path', 'name', '_direntry', '_stat', '_lstat')
+
     def __init__(self, path: str) -> None:
         """
         Initialize a new instance of the PathEntry class.
@@ -21,7 +24,32 @@ class PathEntry:
         :type path: str
         """
         self.path = path
-        self.name = os.path.basename(path)
+        self.name = path.rpartition(os.sep)[2]
+        self._direntry: Optional[os.DirEntry] = None
+        self._stat: Optional[os.stat_result] = None
+        self._lstat: Optional[os.stat_result] = None
+
+    @classmethod
+    def from_direntry(cls, direntry: os.DirEntry) -> 'PathEntry':
+        """
+        Create a new PathEntry from an os.DirEntry returned by os.scandir().
+
+        The type and stat queries are delegated to the DirEntry, which caches them and can usually answer type
+        queries from the directory listing itself, without any extra system call.
+
+        :param direntry: A DirEntry returned by os.scandir().
+        :type direntry: os.DirEntry
+        :return: A PathEntry for the same path.
+        :rtype: PathEntry
+        """
+        # Skip __init__, the DirEntry already knows its name
+        entry = cls.__new__(cls)
+        entry.path = direntry.path
+        entry.name = direntry.name
+        entry._direntry = direntry
+        entry._stat = None
+        entry._lstat = None
+        return entry
 
     def is_dir(self, follow_symlinks: bool = True) -> bool:
         """
@@ -34,10 +62,14 @@ class PathEntry:
         :return: True if the path represents a directory, False otherwise.
         :rtype: bool
         """
-        if follow_symlinks:
-            return os.path.isdir(self.path)
-        else:
-            return stat.S_ISDIR(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        if self._direntry is not None:
+            try:
+                return self._direntry.is_dir(follow_symlinks=follow_symlinks)
+            except OSError:  # Circular symbolic link, same as the path-based check below
+                if not follow_symlinks:
+                    raise
+                return False
+        return self._test_mode(stat.S_ISDIR, follow_symlinks)
 
     def is_file(self, follow_symlinks: bool = True) -> bool:
         """
@@ -50,10 +82,14 @@ class PathEntry:
         :return: True if the path represents a file, False otherwise.
         :rtype: bool
         """
-        if follow_symlinks:
-            return os.path.isfile(self.path)
-        else:
-            return stat.S_ISREG(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        if self._direntry is not None:
+            try:
+                return self._direntry.is_file(follow_symlinks=follow_symlinks)
+            except OSError:  # Circular symbolic link, same as the path-based check below
+                if not follow_symlinks:
+                    raise
+                return False
+        return self._test_mode(stat.S_ISREG, follow_symlinks)
 
     def is_symlink(self) -> bool:
         """
@@ -62,12 +98,60 @@ class PathEntry:
         :return: True if the path represents a symbolic link, False otherwise.
         :rtype: bool
         """
-        return os.path.islink(self.path)
+        if self._direntry is not None:
+            return self._direntry.is_symlink()
+        try:
+            return stat.S_ISLNK(self.stat(follow_symlinks=False).st_mode)
+        except OSError:
+            return False
+
+    def exists(self) -> bool:
+        """
+        Check if the path exists, following symlinks.
+
+        :return: True if the path exists, False otherwise (for example for broken symbolic links).
+        :rtype: bool
+        """
+        try:
+            self.stat()
+        except OSError:
+            return False
+        return True
+
+    def _test_mode(self, predicate: Callable[[int], bool], follow_symlinks: bool) -> bool:
+        """
+        Apply a stat.S_IS* predicate to the (cached) mode of the path.
+
+        When following symlinks, a path that can't be stat'ed is reported as not matching, like os.path.isdir() and
+        os.path.isfile() do. is_dir() and is_file() follow the same rule for entries created from an os.DirEntry.
+        """
+        if not follow_symlinks:
+            return predicate(self.stat(follow_symlinks=False).st_mode)
+        try:
+            return predicate(self.stat().st_mode)
+        except OSError:
+            return False
+
+    def inode(self) -> int:
+        """
+        Return the inode number of the path.
+
+        When the entry was created from an os.DirEntry, this doesn't require any system call.
+
+        :return: The inode number of the path, without following symlinks.
+        :rtype: int
+        """
+        if self._direntry is not None:
+            return self._direntry.inode()
+        return self.stat(follow_symlinks=False).st_ino
 
     def stat(self, follow_symlinks: bool = True) -> os.stat_result:
         """
         Perform a stat system call on the given path.
 
+        The result is cached, so that querying the type, size and mode of an entry only costs at most two system
+        calls. When the path isn't a symlink, the lstat result is reused for stat.
+
         :param follow_symlinks: If True (default), symlinks are followed, similar to os.stat(). If False, symlinks are
                                 not followed, similar to os.lstat().
         :type follow_symlinks: bool
@@ -75,6 +159,18 @@ class PathEntry:
         :rtype: os.stat_result
         """
         if follow_symlinks:
-            return os.stat(self.path)
-        else:
-            return os.lstat(self.path)
\ No newline at end of file
+            if self._stat is None:
+                if self._lstat is not None and not stat.S_ISLNK(self._lstat.st_mode):
+                    self._stat = self._lstat
+                elif self._direntry is not None:
+                    self._stat = self._direntry.stat(follow_symlinks=True)
+                else:
+                    self._stat = os.stat(self.path)
+            return self._stat
+
+        if self._lstat is None:
+            if self._direntry is not None:
+                self._lstat = self._direntry.stat(follow_symlinks=False)
+            else:
+                self._lstat = os.lstat(self.path)
+        return self._lstat
\ No newline at end of file